@@ -6,20 +6,39 @@ Provides comprehensive tools for debugging database connectivity issues.
 import os
 import sys
 import time
+import errno
+import select
+import struct
+import random
+import asyncio
 import socket
 import logging
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import contextmanager
 
 try:
     import pyodbc
+    # Enable driver-manager connection pooling; must be set before the first connect
+    pyodbc.pooling = True
     HAS_PYODBC = True
 except ImportError:
     HAS_PYODBC = False
 
 try:
-    from django.conf import settings
+    import aioodbc
+    HAS_AIOODBC = True
+except ImportError:
+    HAS_AIOODBC = False
+
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
+try:
     from django.db import connection
     from django.core.management import execute_from_command_line
     HAS_DJANGO = True
@@ -33,12 +52,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Resolved addresses keyed by (host, family) -> (ip, resolved_at)
+DNS_CACHE_TTL = int(os.getenv('DNS_CACHE_TTL', '300'))
+_DNS_CACHE: Dict[Tuple[str, int], Tuple[str, float]] = {}
+
+# Cross-process DNS cache on tmpfs so new worker processes start warm
+DNS_CACHE_DIR = os.getenv('DNS_CACHE_DIR', '/dev/shm/dns_cache')
+# Set once opening fails so each process only tries the shared cache once
+_SHARED_DNS_CACHE_UNAVAILABLE = object()
+_shared_dns_cache = None
+
+
+def _get_shared_dns_cache():
+    """Open the shared DNS cache, or return None if it is unavailable."""
+    global _shared_dns_cache
+    if _shared_dns_cache is None and HAS_DISKCACHE:
+        try:
+            # Short SQLite busy timeout so a locked cache can't stall a probe
+            _shared_dns_cache = diskcache.Cache(DNS_CACHE_DIR, timeout=0.1)
+        except Exception as e:
+            logger.debug(f"Shared DNS cache unavailable: {e}")
+            _shared_dns_cache = _SHARED_DNS_CACHE_UNAVAILABLE
+    if _shared_dns_cache is _SHARED_DNS_CACHE_UNAVAILABLE:
+        return None
+    return _shared_dns_cache
+
+
+def _resolve(host: str, ttl: int = DNS_CACHE_TTL, family: int = socket.AF_INET) -> str:
+    """Resolve a hostname to an IP address, caching the result for ttl seconds."""
+    key = (host, family)
+    cached = _DNS_CACHE.get(key)
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < ttl:
+        return cached[0]
+    
+    shared = _get_shared_dns_cache()
+    shared_key = f"{host}|{family}"
+    if shared is not None:
+        # The shared cache is an optimisation; any failure falls back to DNS
+        try:
+            ip, expire_time = shared.get(shared_key, expire_time=True)
+        except Exception as e:
+            logger.debug(f"Shared DNS cache read failed: {e}")
+            ip = None
+        if ip is not None:
+            # Keep the local entry no longer than the shared one
+            remaining = expire_time - time.time() if expire_time else ttl
+            _DNS_CACHE[key] = (ip, now - max(ttl - remaining, 0))
+            return ip
+    
+    addrinfo = socket.getaddrinfo(host, None, family, socket.SOCK_STREAM)
+    ip = addrinfo[0][4][0]
+    _DNS_CACHE[key] = (ip, now)
+    if shared is not None:
+        try:
+            shared.set(shared_key, ip, expire=ttl)
+        except Exception as e:
+            logger.debug(f"Shared DNS cache write failed: {e}")
+    return ip
+
+
+# SQLSTATEs raised while the server is unreachable or still starting up
+TIMEOUT_SQLSTATES = frozenset({'08001', 'HYT00', 'HYT01'})
+
+
+# Driver to fall back to when the configured one is not installed (IM002)
+ALTERNATE_DRIVER = 'ODBC Driver 17 for SQL Server'
+
+
+def _sqlstate(exc: Optional[Exception]) -> Optional[str]:
+    """Return the SQLSTATE of a pyodbc error, or None."""
+    if not HAS_PYODBC or not isinstance(exc, pyodbc.Error) or not exc.args:
+        return None
+    return exc.args[0]
+
+
+def _is_timeout_error(exc: Optional[Exception]) -> bool:
+    """Return True if exc is a pyodbc connection/login timeout."""
+    return _sqlstate(exc) in TIMEOUT_SQLSTATES
+
+
+def _probe_port(ip: str, port: int, timeout: float) -> int:
+    """
+    Attempt a non-blocking TCP connect and wait for it with select().
+    
+    Returns 0 on success, otherwise the socket error code (ETIMEDOUT if
+    the connect did not complete within timeout).
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        # Reset on close instead of leaving the probe socket in TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        sock.setblocking(False)
+        result = sock.connect_ex((ip, port))
+        if result == 0:
+            return 0
+        if result not in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            return result
+        
+        _, writable, _ = select.select([], [sock], [], timeout)
+        if not writable:
+            return errno.ETIMEDOUT
+        return sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+    finally:
+        sock.close()
+
+
+# Seconds to pause between refused connects while waiting for the port
+PORT_POLL_INTERVAL = 0.1
+
+# Upper bound in seconds for the wait_for_database backoff
+MAX_BACKOFF = 30
+
+# Installed ODBC drivers only change when the image is rebuilt
+_DRIVERS_CACHE: Optional[List[str]] = None
+
+
+def _get_odbc_drivers() -> List[str]:
+    """Return the installed ODBC drivers, enumerating them only once."""
+    global _DRIVERS_CACHE
+    if _DRIVERS_CACHE is None:
+        _DRIVERS_CACHE = pyodbc.drivers()
+    return _DRIVERS_CACHE
+
+
+_DJANGO_READY = False
+
+
+def _ensure_django() -> bool:
+    """Configure Django once per process; return False if it is unavailable."""
+    global _DJANGO_READY
+    if _DJANGO_READY:
+        return True
+    if not HAS_DJANGO:
+        return False
+    
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'familyhub_timesheet.settings.production')
+    import django
+    django.setup()
+    _DJANGO_READY = True
+    return True
+
+
+class _RollbackTest(Exception):
+    """Raised to roll back the deep database operations test."""
+
 
 class DatabaseConnectionTester:
     """Comprehensive database connection testing utilities."""
     
-    def __init__(self):
+    def __init__(self, connection_params: Optional[Dict[str, Any]] = None):
         self.connection_params = self._get_connection_params()
+        if connection_params:
+            self.connection_params.update(connection_params)
+        self.last_error: Optional[Exception] = None
+        # Connection kept open after the first successful raw probe
+        self._probe_conn = None
         
     def _get_connection_params(self) -> Dict[str, Any]:
         """Extract connection parameters from environment or defaults."""
@@ -53,27 +222,21 @@ class DatabaseConnectionTester:
             'encrypt': 'no'  # For local development
         }
     
-    def test_network_connectivity(self) -> bool:
+    def test_network_connectivity(self, timeout: float = 2) -> bool:
         """Test basic network connectivity to SQL Server."""
         logger.info("Testing network connectivity...")
         
         try:
-            # Test DNS resolution
-            socket.gethostbyname(self.connection_params['server'])
+            # Test DNS resolution (cached between probes)
+            ip = _resolve(self.connection_params['server'])
             logger.info(f"✓ DNS resolution successful for {self.connection_params['server']}")
         except socket.gaierror as e:
             logger.error(f"✗ DNS resolution failed: {e}")
             return False
         
         try:
-            # Test port connectivity
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(10)
-            result = sock.connect_ex((
-                self.connection_params['server'], 
-                self.connection_params['port']
-            ))
-            sock.close()
+            # Test port connectivity against the resolved address
+            result = _probe_port(ip, self.connection_params['port'], timeout)
             
             if result == 0:
                 logger.info(f"✓ Port {self.connection_params['port']} is accessible")
@@ -95,7 +258,7 @@ class DatabaseConnectionTester:
             return False
         
         try:
-            drivers = pyodbc.drivers()
+            drivers = _get_odbc_drivers()
             logger.info(f"Available ODBC drivers: {drivers}")
             
             if self.connection_params['driver'] in drivers:
@@ -109,58 +272,147 @@ class DatabaseConnectionTester:
             logger.error(f"✗ Error checking ODBC drivers: {e}")
             return False
     
-    def test_raw_connection(self) -> bool:
-        """Test raw pyodbc connection to SQL Server."""
+    def test_raw_connection(self, fast_fail: bool = False, timeout: int = 30) -> bool:
+        """
+        Test raw pyodbc connection to SQL Server.
+        
+        A connection kept from an earlier successful probe is reused while it
+        still answers SELECT 1.  Otherwise the canonical connection string is tried first.  On failure, a single
+        variant chosen from the error's SQLSTATE is tried, unless fast_fail is
+        set.  The last failure is kept in self.last_error for the caller.
+        """
         logger.info("Testing raw pyodbc connection...")
         
         if not HAS_PYODBC:
             logger.error("✗ pyodbc is not available")
             return False
         
-        connection_strings = self._get_connection_strings()
-        
-        for i, conn_str in enumerate(connection_strings, 1):
-            logger.info(f"Trying connection string {i}/{len(connection_strings)}...")
+        if self._probe_conn is not None:
             try:
-                conn = pyodbc.connect(conn_str, timeout=30)
-                cursor = conn.cursor()
+                cursor = self._probe_conn.cursor()
                 cursor.execute("SELECT 1 as test")
                 result = cursor.fetchone()
                 cursor.close()
-                conn.close()
-                
                 if result and result[0] == 1:
-                    logger.info(f"✓ Raw connection successful with string {i}")
+                    logger.info("✓ Raw connection successful (reused)")
                     return True
-                    
-            except Exception as e:
-                logger.warning(f"✗ Connection string {i} failed: {e}")
-                continue
+            except pyodbc.Error as e:
+                logger.warning(f"Reused connection failed, reconnecting: {e}")
+            self.close()
         
-        logger.error("✗ All connection strings failed")
+        if self._try_connect(self._get_connection_string(), timeout):
+            return True
+        
+        if not fast_fail:
+            fallback = self._get_fallback_connection_string(self.last_error)
+            if fallback is not None:
+                logger.info(f"Retrying with variant for SQLSTATE {_sqlstate(self.last_error)}...")
+                if self._try_connect(fallback, timeout):
+                    return True
+        
+        logger.error("✗ Raw connection failed")
         return False
     
-    def _get_connection_strings(self):
-        """Generate multiple connection string variations to try."""
+    def _try_connect(self, conn_str: str, timeout: int) -> bool:
+        """Connect with a single connection string and run SELECT 1."""
+        self.last_error = None
+        try:
+            conn = pyodbc.connect(conn_str, timeout=timeout)
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 as test")
+            result = cursor.fetchone()
+            cursor.close()
+            
+            if result and result[0] == 1:
+                logger.info("✓ Raw connection successful")
+                # Keep the handle so later probes skip the login handshake
+                self._probe_conn = conn
+                return True
+            conn.close()
+            return False
+                
+        except Exception as e:
+            self.last_error = e
+            logger.warning(f"✗ Connection failed: {e}")
+            return False
+    
+    def close(self):
+        """Close the connection kept from the last successful raw probe."""
+        if self._probe_conn is not None:
+            try:
+                self._probe_conn.close()
+            except Exception:
+                pass
+            self._probe_conn = None
+    
+    async def test_raw_connection_async(self, timeout: int = 30) -> bool:
+        """Test raw connection to SQL Server without blocking the event loop."""
         params = self.connection_params
-        base_params = f"DRIVER={{{params['driver']}}};SERVER={params['server']},{params['port']};UID={params['username']};PWD={params['password']}"
+        target = f"{params['server']}:{params['port']}/{params['database']}"
         
-        return [
-            # Standard connection with database
-            f"{base_params};DATABASE={params['database']};TrustServerCertificate={params['trust_certificate']};Encrypt={params['encrypt']};",
-            
-            # Without specifying database
-            f"{base_params};TrustServerCertificate={params['trust_certificate']};Encrypt={params['encrypt']};",
-            
-            # With encryption enabled
-            f"{base_params};DATABASE={params['database']};TrustServerCertificate={params['trust_certificate']};Encrypt=yes;",
+        if not HAS_AIOODBC:
+            logger.error("✗ aioodbc is not available")
+            return False
+        
+        try:
+            conn = await aioodbc.connect(dsn=self._get_connection_string(), timeout=timeout)
+            try:
+                cursor = await conn.cursor()
+                await cursor.execute("SELECT 1 as test")
+                result = await cursor.fetchone()
+                await cursor.close()
+            finally:
+                await conn.close()
             
-            # Alternative server format
-            f"DRIVER={{{params['driver']}}};SERVER=tcp:{params['server']},{params['port']};UID={params['username']};PWD={params['password']};DATABASE={params['database']};TrustServerCertificate={params['trust_certificate']};Encrypt={params['encrypt']};",
+            if result and result[0] == 1:
+                logger.info(f"✓ Raw connection successful for {target}")
+                return True
+            return False
             
-            # With connection timeout
-            f"{base_params};DATABASE={params['database']};TrustServerCertificate={params['trust_certificate']};Encrypt={params['encrypt']};Connection Timeout=30;",
-        ]
+        except Exception as e:
+            logger.warning(f"✗ Connection to {target} failed: {e}")
+            return False
+    
+    def _build_connection_string(self, **overrides) -> str:
+        """
+        Build a connection string with keys in a fixed order.
+        
+        The ODBC driver manager matches pooled connections byte-for-byte,
+        so every string must be assembled the same way.  Pass a value of
+        None to omit a key.
+        """
+        params = self.connection_params
+        parts = {
+            'DRIVER': f"{{{params['driver']}}}",
+            'SERVER': f"{params['server']},{params['port']}",
+            'DATABASE': params['database'],
+            'UID': params['username'],
+            'PWD': params['password'],
+            'TrustServerCertificate': params['trust_certificate'],
+            'Encrypt': params['encrypt'],
+        }
+        parts.update(overrides)
+        return ''.join(f"{key}={value};" for key, value in parts.items() if value is not None)
+    
+    def _get_connection_string(self) -> str:
+        """Return the canonical connection string."""
+        return self._build_connection_string()
+    
+    def _get_fallback_connection_string(self, exc: Exception) -> Optional[str]:
+        """Pick a connection string variant based on the SQLSTATE of a failure."""
+        params = self.connection_params
+        state = _sqlstate(exc)
+        
+        if state == '28000':
+            # Login failed - the login's default database may not exist yet
+            return self._build_connection_string(DATABASE=None)
+        if state == '08001':
+            # Client unable to establish connection - force the TCP protocol
+            return self._build_connection_string(SERVER=f"tcp:{params['server']},{params['port']}")
+        if state == 'IM002':
+            # Driver not found - try the previous driver generation
+            return self._build_connection_string(DRIVER=f"{{{ALTERNATE_DRIVER}}}")
+        return None
     
     def test_django_connection(self) -> bool:
         """Test Django database connection."""
@@ -172,10 +424,8 @@ class DatabaseConnectionTester:
         
         try:
             # Configure Django settings
-            if not settings.configured:
-                os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'familyhub_timesheet.settings.production')
-                import django
-                django.setup()
+            if not _ensure_django():
+                return False
             
             # Test connection
             from django.db import connection
@@ -194,8 +444,14 @@ class DatabaseConnectionTester:
             logger.error(f"✗ Django database connection error: {e}")
             return False
     
-    def test_database_operations(self) -> bool:
-        """Test basic database operations."""
+    def test_database_operations(self, deep: bool = False) -> bool:
+        """
+        Test basic database operations.
+        
+        By default this is a single SELECT 1 over the Django connection.
+        With deep, a temp table is created, written and read inside a
+        transaction that is rolled back, so nothing needs to be dropped.
+        """
         logger.info("Testing database operations...")
         
         try:
@@ -204,31 +460,31 @@ class DatabaseConnectionTester:
                 return True
                 
             # Configure Django settings
-            if not settings.configured:
-                os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'familyhub_timesheet.settings.production')
-                import django
-                django.setup()
+            if not _ensure_django():
+                return False
             
-            from django.db import connection
+            from django.db import connection, transaction
             
-            # Test table creation capability
-            with connection.cursor() as cursor:
-                cursor.execute("""
-                    IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='test_connection' AND xtype='U')
-                    CREATE TABLE test_connection (id INT PRIMARY KEY, test_value NVARCHAR(50))
-                """)
-                
-                # Test insert
-                cursor.execute("INSERT INTO test_connection (id, test_value) VALUES (1, 'test')")
-                
-                # Test select
-                cursor.execute("SELECT test_value FROM test_connection WHERE id = 1")
-                result = cursor.fetchone()
-                
-                # Cleanup
-                cursor.execute("DROP TABLE test_connection")
+            if not deep:
+                with connection.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    result = cursor.fetchone()
+                ok = bool(result and result[0] == 1)
+            else:
+                try:
+                    with transaction.atomic():
+                        with connection.cursor() as cursor:
+                            # Temp table lives only for this connection
+                            cursor.execute("CREATE TABLE #test_connection (id INT PRIMARY KEY, test_value NVARCHAR(50))")
+                            cursor.execute("INSERT INTO #test_connection (id, test_value) VALUES (1, 'test')")
+                            cursor.execute("SELECT test_value FROM #test_connection WHERE id = 1")
+                            result = cursor.fetchone()
+                        raise _RollbackTest
+                except _RollbackTest:
+                    pass
+                ok = bool(result and result[0] == 'test')
                 
-            if result and result[0] == 'test':
+            if ok:
                 logger.info("✓ Database operations test successful")
                 return True
             else:
@@ -240,24 +496,68 @@ class DatabaseConnectionTester:
             return False
     
     def wait_for_database(self, max_attempts: int = 30, delay: int = 2) -> bool:
-        """Wait for database to become available with retry logic."""
-        logger.info(f"Waiting for database (max {max_attempts} attempts, {delay}s delay)...")
+        """Wait for database to become available, backing off exponentially between attempts."""
+        logger.info(f"Waiting for database (max {max_attempts} attempts, {delay}s initial delay)...")
+        
+        # Keep each probe short; a booting server will be retried anyway
+        connect_timeout = min(delay * 2, 5)
+        # Backoff must not stretch the overall wait past max_attempts * delay
+        timeout = max_attempts * delay
+        deadline = time.monotonic() + timeout
         
         for attempt in range(1, max_attempts + 1):
             logger.info(f"Attempt {attempt}/{max_attempts}")
             
-            if self.test_network_connectivity() and self.test_raw_connection():
-                logger.info("✓ Database is ready!")
-                return True
+            port_open = self.test_network_connectivity(timeout=connect_timeout)
+            if port_open:
+                if self.test_raw_connection(fast_fail=True, timeout=connect_timeout):
+                    logger.info("✓ Database is ready!")
+                    return True
+                
+                # Only try a connection string variant for auth/driver
+                # errors; a timeout just means the server is still starting
+                if not _is_timeout_error(self.last_error):
+                    fallback = self._get_fallback_connection_string(self.last_error)
+                    if fallback is not None and self._try_connect(fallback, connect_timeout):
+                        logger.info("✓ Database is ready!")
+                        return True
+            
+            remaining = deadline - time.monotonic()
+            if attempt >= max_attempts or remaining <= 0:
+                break
             
-            if attempt < max_attempts:
-                logger.info(f"Database not ready, waiting {delay} seconds...")
-                time.sleep(delay)
+            # Exponential backoff with jitter so replicas don't probe in lockstep
+            backoff = min(delay * (2 ** min(attempt - 1, 6)), MAX_BACKOFF)
+            sleep_for = min(backoff * (0.5 + random.random()), remaining)
+            logger.info(f"Database not ready, waiting up to {sleep_for:.1f} seconds...")
+            if port_open:
+                time.sleep(sleep_for)
+            else:
+                # Retry as soon as the port starts accepting connections
+                self._wait_for_port(sleep_for)
         
-        logger.error("✗ Database did not become available within timeout")
+        logger.error(f"✗ Database did not become available within {timeout} seconds")
         return False
     
-    def run_full_diagnostic(self) -> Dict[str, bool]:
+    def _wait_for_port(self, timeout: float) -> bool:
+        """Poll the database port until it accepts connections or timeout expires."""
+        deadline = time.monotonic() + timeout
+        try:
+            ip = _resolve(self.connection_params['server'])
+        except socket.gaierror:
+            time.sleep(timeout)
+            return False
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if _probe_port(ip, self.connection_params['port'], remaining) == 0:
+                return True
+            # Refused connects return immediately; avoid spinning
+            time.sleep(min(PORT_POLL_INTERVAL, max(deadline - time.monotonic(), 0)))
+    
+    def run_full_diagnostic(self, deep: bool = False) -> Dict[str, bool]:
         """Run comprehensive database connectivity diagnostic."""
         logger.info("=" * 50)
         logger.info("SQL Server Connection Diagnostic")
@@ -271,16 +571,43 @@ class DatabaseConnectionTester:
             ('ODBC Drivers', self.check_odbc_drivers),
             ('Raw Connection', self.test_raw_connection),
             ('Django Connection', self.test_django_connection),
-            ('Database Operations', self.test_database_operations),
+            ('Database Operations', lambda: self.test_database_operations(deep=deep)),
         ]
         
-        for test_name, test_func in tests:
-            logger.info(f"\n--- {test_name} ---")
+        # The I/O-bound tests are independent, so run them concurrently;
+        # the driver check is pure Python and stays on this thread.
+        io_tests = [(name, func) for name, func in tests if name != 'ODBC Drivers']
+        
+        # django.setup() is not safe to run from two workers at once, so
+        # configure Django here before the Django tests are submitted
+        try:
+            _ensure_django()
+        except Exception as e:
+            logger.error(f"✗ Django setup failed: {e}")
+            for test_name in ('Django Connection', 'Database Operations'):
+                results[test_name] = False
+            io_tests = [(name, func) for name, func in io_tests if name not in results]
+        
+        with ThreadPoolExecutor(max_workers=len(io_tests)) as executor:
+            futures = {executor.submit(func): name for name, func in io_tests}
+            
+            logger.info("\n--- ODBC Drivers ---")
             try:
-                results[test_name] = test_func()
+                results['ODBC Drivers'] = self.check_odbc_drivers()
             except Exception as e:
-                logger.error(f"✗ {test_name} failed with exception: {e}")
-                results[test_name] = False
+                logger.error(f"✗ ODBC Drivers failed with exception: {e}")
+                results['ODBC Drivers'] = False
+            
+            for future in as_completed(futures):
+                test_name = futures[future]
+                try:
+                    results[test_name] = future.result()
+                except Exception as e:
+                    logger.error(f"✗ {test_name} failed with exception: {e}")
+                    results[test_name] = False
+        
+        # Report in the declared test order
+        results = {test_name: results[test_name] for test_name, _ in tests}
         
         # Summary
         logger.info("\n" + "=" * 50)
@@ -303,6 +630,27 @@ class DatabaseConnectionTester:
         
         return results
 
+    async def run_full_diagnostic_async(self, targets: List[Dict[str, Any]]) -> Dict[str, bool]:
+        """
+        Check raw connectivity to several databases concurrently.
+        
+        Each target is a dict of connection parameter overrides (server,
+        port, database, ...) applied on top of this tester's parameters.
+        """
+        testers = [
+            DatabaseConnectionTester({**self.connection_params, **target})
+            for target in targets
+        ]
+        outcomes = await asyncio.gather(
+            *[tester.test_raw_connection_async() for tester in testers]
+        )
+        
+        results = {}
+        for tester, outcome in zip(testers, outcomes):
+            params = tester.connection_params
+            results[f"{params['server']}:{params['port']}/{params['database']}"] = outcome
+        return results
+
 
 def check_container_environment():
     """Check if we're running in a Docker container and log environment info."""
@@ -332,6 +680,7 @@ if __name__ == "__main__":
     parser.add_argument('--health-check', action='store_true', help='Run health check (exit code based)')
     parser.add_argument('--wait', action='store_true', help='Wait for database to become available')
     parser.add_argument('--full', action='store_true', help='Run full diagnostic')
+    parser.add_argument('--deep', action='store_true', help='Include table create/insert/select in the full diagnostic')
     
     args = parser.parse_args()
     
@@ -350,7 +699,7 @@ if __name__ == "__main__":
     
     elif args.full:
         # Full diagnostic mode
-        results = tester.run_full_diagnostic()
+        results = tester.run_full_diagnostic(deep=args.deep)
         success = all(results.values())
         sys.exit(0 if success else 1)
     
@@ -103,10 +103,6 @@ if ($LASTEXITCODE -ne 0) {
 Write-Host "📦 Collecting static files..." -ForegroundColor Yellow
 docker-compose exec web python manage.py collectstatic --noinput --settings=familyhub_timesheet.settings.production
 
-# Create cache table
-Write-Host "💾 Creating cache table..." -ForegroundColor Yellow
-docker-compose exec web python manage.py createcachetable --settings=familyhub_timesheet.settings.production
-
 # Create superuser
 if (-not $SkipPrompts) {
     Write-Host "👤 Creating superuser..." -ForegroundColor Yellow
@@ -73,10 +73,6 @@ docker-compose exec web python manage.py migrate --settings=familyhub_timesheet.
 echo "📦 Collecting static files..."
 docker-compose exec web python manage.py collectstatic --noinput --settings=familyhub_timesheet.settings.production
 
-# Create cache table
-echo "💾 Creating cache table..."
-docker-compose exec web python manage.py createcachetable --settings=familyhub_timesheet.settings.production
-
 # Create superuser
 echo "👤 Creating superuser..."
 echo "Please create a superuser account for admin access:"
@@ -4,6 +4,7 @@ Routes queries to primary or fallback database based on availability.
 """
 
 import logging
+import threading
 import time
 from django.conf import settings
 
@@ -15,58 +16,80 @@ class DatabaseRouter:
     Database router that handles primary/fallback database selection.
     """
     
+    __slots__ = (
+        'primary_available',
+        'check_interval',
+        '_fallback_enabled',
+        '_has_fallback_db',
+    )
+    
     def __init__(self):
-        self.last_primary_check = 0
-        self.primary_available = None
+        self.primary_available = True  # Assume primary is up until the probe says otherwise
         self.check_interval = 60  # Check every minute
+        
+        # Settings are fixed for the process lifetime; read them once
+        self._fallback_enabled = getattr(settings, 'ENABLE_DATABASE_FALLBACK', False)
+        self._has_fallback_db = 'sqlite_fallback' in settings.DATABASES
+        
+        # Probe primary availability off the request path
+        if self._fallback_enabled:
+            probe = threading.Thread(
+                target=self._probe_loop,
+                name='db-router-probe',
+                daemon=True,
+            )
+            probe.start()
     
     def _test_database_connection(self, database_alias):
         """Test if a database connection is working."""
         try:
             from django.db import connections
             
+            # Reuse the persistent (CONN_MAX_AGE) connection held by this thread
             conn = connections[database_alias]
-            with conn.cursor() as cursor:
-                cursor.execute("SELECT 1")
-                result = cursor.fetchone()
-                
-            return result and result[0] == 1
+            conn.ensure_connection()
+            if conn.is_usable():
+                return True
+            
+            # Stale handle - drop it so the next probe reconnects
+            conn.close()
+            return False
             
         except Exception as e:
             logger.warning(f"Database connection test failed for {database_alias}: {e}")
+            try:
+                # Drop the broken handle so the next probe reconnects
+                connections[database_alias].close()
+            except Exception:
+                pass
             return False
     
-    def _is_primary_available(self):
-        """Check if primary database is available with caching."""
-        current_time = time.time()
-        
-        # Use cached result if recent
-        if (current_time - self.last_primary_check) < self.check_interval:
-            return self.primary_available
-        
-        # Test primary database
-        self.primary_available = self._test_database_connection('default')
-        self.last_primary_check = current_time
-        
-        if self.primary_available:
-            logger.info("Primary database is available")
-        else:
-            logger.warning("Primary database is not available")
-        
-        return self.primary_available
+    def _probe_loop(self):
+        """Periodically refresh primary availability in the background."""
+        while True:
+            available = bool(self._test_database_connection('default'))
+            
+            if available != self.primary_available:
+                if available:
+                    logger.info("Primary database is available")
+                else:
+                    logger.warning("Primary database is not available")
+            
+            self.primary_available = available
+            time.sleep(self.check_interval)
     
     def _get_target_database(self):
         """Determine which database to use."""
         # If fallback is disabled, always use primary
-        if not getattr(settings, 'ENABLE_DATABASE_FALLBACK', False):
+        if not self._fallback_enabled:
             return 'default'
         
         # Check if primary is available
-        if self._is_primary_available():
+        if self.primary_available:
             return 'default'
         
         # Check if fallback database exists in settings
-        if 'sqlite_fallback' in settings.DATABASES:
+        if self._has_fallback_db:
             logger.info("Using fallback database")
             return 'sqlite_fallback'
         
@@ -4,7 +4,10 @@ This file contains comprehensive SQL Server configuration with debugging and ret
 """
 
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueListener
 import structlog
 from decouple import config
 from .base import *
@@ -17,7 +20,23 @@ SECRET_KEY = config('SECRET_KEY', default='django-insecure-change-me-in-producti
 DEBUG = config('DEBUG', default=False, cast=bool)
 
 # Allowed hosts
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1,0.0.0.0,*').split(',')
+ALLOWED_HOSTS = tuple(
+    h.strip().lower() for h in config('ALLOWED_HOSTS', default='localhost,127.0.0.1,0.0.0.0,*').split(',')
+)
+
+# Create logs directory if it doesn't exist
+os.makedirs('/app/logs', exist_ok=True)
+
+# Per-query SQL logging is expensive; raise to DEBUG only when diagnosing
+DB_LOG_LEVEL = config('DB_LOG_LEVEL', default='WARNING')
+DB_FILE_LOG_LEVEL = config('DB_FILE_LOG_LEVEL', default='WARNING')
+
+# File handlers write from a background listener thread; request threads
+# only enqueue records (see the QueueListener setup below LOGGING)
+_app_log_queue = queue.Queue(-1)
+_db_log_queue = queue.Queue(-1)
+
+VERBOSE_LOG_FORMAT = '{levelname} {asctime} {module} {process:d} {thread:d} {message}'
 
 # Enhanced Logging Configuration
 LOGGING = {
@@ -25,16 +44,17 @@ LOGGING = {
     'disable_existing_loggers': False,
     'formatters': {
         'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
+            'format': VERBOSE_LOG_FORMAT,
             'style': '{',
         },
         'simple': {
             'format': '{levelname} {message}',
             'style': '{',
         },
-        'json': {
-            '()': structlog.stdlib.ProcessorFormatter,
-            'processor': structlog.dev.ConsoleRenderer(colors=False),
+    },
+    'filters': {
+        'require_debug_false': {
+            '()': 'django.utils.log.RequireDebugFalse',
         },
     },
     'handlers': {
@@ -43,27 +63,47 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'verbose',
         },
+        'file': {
+            'level': 'INFO',
+            'class': 'logging.handlers.QueueHandler',
+            'queue': _app_log_queue,
+        },
         'db_file': {
-            'level': 'DEBUG',
-            'class': 'logging.FileHandler',
-            'filename': '/app/logs/database.log',
-            'formatter': 'json',
+            'level': DB_FILE_LOG_LEVEL,
+            'class': 'logging.handlers.QueueHandler',
+            'queue': _db_log_queue,
+        },
+        'mail_admins': {
+            'level': 'ERROR',
+            'filters': ['require_debug_false'],
+            'class': 'django.utils.log.AdminEmailHandler',
+            'formatter': 'verbose',
         },
     },
     'loggers': {
+        'django': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
+        'django.request': {
+            'handlers': ['console', 'file', 'mail_admins'],
+            'level': 'ERROR',
+            'propagate': False,
+        },
         'django.db.backends': {
             'handlers': ['console', 'db_file'],
-            'level': 'DEBUG',
+            'level': DB_LOG_LEVEL,
             'propagate': False,
         },
         'mssql': {
             'handlers': ['console', 'db_file'],
-            'level': 'DEBUG',
+            'level': DB_LOG_LEVEL,
             'propagate': False,
         },
         'pyodbc': {
             'handlers': ['console', 'db_file'],
-            'level': 'DEBUG',
+            'level': DB_LOG_LEVEL,
             'propagate': False,
         },
         'familyhub_timesheet': {
@@ -71,6 +111,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'timesheet': {
+            'handlers': ['console', 'file'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
     'root': {
         'handlers': ['console'],
@@ -78,6 +123,35 @@ LOGGING = {
     },
 }
 
+_app_file_handler = logging.FileHandler('/app/logs/django.log')
+_app_file_handler.setFormatter(logging.Formatter(VERBOSE_LOG_FORMAT, style='{'))
+
+_db_file_handler = logging.FileHandler('/app/logs/database.log')
+_db_file_handler.setFormatter(
+    structlog.stdlib.ProcessorFormatter(processor=structlog.dev.ConsoleRenderer(colors=False))
+)
+
+_log_listeners = [
+    QueueListener(_app_log_queue, _app_file_handler),
+    QueueListener(_db_log_queue, _db_file_handler),
+]
+for _listener in _log_listeners:
+    _listener.start()
+    atexit.register(_listener.stop)
+
+# Extra ODBC connection string parameters for SQL Server
+_EXTRA_PARAMS = ';'.join((
+    'TrustServerCertificate=yes',
+    'Encrypt=no',  # For local development
+    'Connection Timeout=30',
+    'Command Timeout=60',
+    'Login Timeout=30',
+    'MultipleActiveResultSets=True',
+    'ApplicationIntent=ReadWrite',
+    'ConnectRetryCount=3',
+    'ConnectRetryInterval=10',
+))
+
 # Database Configuration with Enhanced SQL Server Support
 DATABASES = {
     'default': {
@@ -89,17 +163,11 @@ DATABASES = {
         'PORT': config('DATABASE_PORT', default='1433'),
         'OPTIONS': {
             'driver': 'ODBC Driver 18 for SQL Server',
-            'extra_params': ';'.join([
-                'TrustServerCertificate=yes',
-                'Encrypt=no',  # For local development
-                'Connection Timeout=30',
-                'Command Timeout=60',
-                'Login Timeout=30',
-                'MultipleActiveResultSets=True',
-                'ApplicationIntent=ReadWrite',
-                'ConnectRetryCount=3',
-                'ConnectRetryInterval=10',
-            ]),
+            'extra_params': _EXTRA_PARAMS,
+            # With READ_COMMITTED_SNAPSHOT enabled on the database (see
+            # db_init/01-init-database.sql), READ COMMITTED reads use row
+            # versions instead of locks
+            'isolation_level': 'READ COMMITTED',
         },
         'CONN_MAX_AGE': 600,  # Connection pooling - 10 minutes
         'CONN_HEALTH_CHECKS': True,
@@ -150,70 +218,6 @@ CSP_FONT_SRC = ("'self'", "https://cdn.jsdelivr.net")
 # Static files configuration for production
 STATICFILES_STORAGE = 'whitenoise.storage.CompressedManifestStaticFilesStorage'
 
-# Logging configuration
-LOGGING = {
-    'version': 1,
-    'disable_existing_loggers': False,
-    'formatters': {
-        'verbose': {
-            'format': '{levelname} {asctime} {module} {process:d} {thread:d} {message}',
-            'style': '{',
-        },
-        'simple': {
-            'format': '{levelname} {message}',
-            'style': '{',
-        },
-    },
-    'filters': {
-        'require_debug_false': {
-            '()': 'django.utils.log.RequireDebugFalse',
-        },
-    },
-    'handlers': {
-        'console': {
-            'level': 'INFO',
-            'class': 'logging.StreamHandler',
-            'formatter': 'simple'
-        },
-        'file': {
-            'level': 'INFO',
-            'class': 'logging.FileHandler',
-            'filename': '/app/logs/django.log',
-            'formatter': 'verbose',
-        },
-        'mail_admins': {
-            'level': 'ERROR',
-            'filters': ['require_debug_false'],
-            'class': 'django.utils.log.AdminEmailHandler',
-            'formatter': 'verbose',
-        }
-    },
-    'root': {
-        'handlers': ['console'],
-    },
-    'loggers': {
-        'django': {
-            'handlers': ['console', 'file'],
-            'level': 'INFO',
-            'propagate': False,
-        },
-        'django.request': {
-            'handlers': ['console', 'file', 'mail_admins'],
-            'level': 'ERROR',
-            'propagate': False,
-        },
-        'timesheet': {
-            'handlers': ['console', 'file'],
-            'level': 'INFO',
-            'propagate': False,
-        },
-    },
-}
-
-# Create logs directory if it doesn't exist
-import os
-os.makedirs('/app/logs', exist_ok=True)
-
 # Email configuration for production
 EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = config('EMAIL_HOST', default='localhost')
@@ -229,13 +233,24 @@ ADMINS = [
 ]
 MANAGERS = ADMINS
 
-# Cache configuration for production
+# Cache configuration for production (Redis keeps cache traffic off SQL Server)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
-        'LOCATION': 'cache_table',
-    }
+        'BACKEND': 'django_redis.cache.RedisCache',
+        'LOCATION': config('REDIS_URL', default='redis://redis:6379/1'),
+        'OPTIONS': {
+            'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            'CONNECTION_POOL_KWARGS': {'max_connections': 50},
+            # Treat a Redis outage as cache misses instead of failing requests
+            'IGNORE_EXCEPTIONS': True,
+        },
+    },
 }
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+
+# Read sessions through the cache, but keep the database as the source of
+# truth so a Redis restart or outage doesn't log everyone out
+SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
 
 # Performance optimizations
 USE_TZ = True
@@ -4,23 +4,37 @@ This file is for testing Docker deployment without SQL Server.
 """
 
 import os
-from decouple import config, Csv
+from functools import lru_cache
+from decouple import config
 from .base import *
 
+
+@lru_cache(maxsize=None)
+def _cached(name, default, cast=None):
+    """Read an environment setting once per process."""
+    if cast is None:
+        return config(name, default=default)
+    return config(name, default=default, cast=cast)
+
+
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = config('SECRET_KEY', default='django-insecure-change-me-in-production')
+SECRET_KEY = _cached('SECRET_KEY', 'django-insecure-change-me-in-production')
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = config('DEBUG', default=False, cast=bool)
+DEBUG = _cached('DEBUG', False, bool)
 
 # Allowed hosts
-ALLOWED_HOSTS = config('ALLOWED_HOSTS', default='localhost,127.0.0.1,0.0.0.0', cast=Csv())
+ALLOWED_HOSTS = tuple(
+    h.strip().lower() for h in _cached('ALLOWED_HOSTS', 'localhost,127.0.0.1,0.0.0.0').split(',')
+)
 
 # Database configuration - Using SQLite for initial testing
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': 60,  # Reuse connections across requests
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
@@ -87,10 +101,22 @@ LOGGING = {
     },
 }
 
-# Cache configuration for production
-CACHES = {
-    'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
-        'LOCATION': 'unique-snowflake',
+# Cache configuration - shared Redis when REDIS_URL is set, else per-process memory
+REDIS_URL = _cached('REDIS_URL', '')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+            # Namespace keys per release so stale objects are never unpickled
+            'KEY_PREFIX': _cached('CACHE_KEY_PREFIX', 'timesheet'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'unique-snowflake',
+        }
     }
-}
@@ -9,7 +9,13 @@ import sys
 import logging
 import socket
 import time
-from typing import Dict, Any
+import errno
+import select
+import random
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
 
 # Setup logging
 logging.basicConfig(
@@ -18,26 +24,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Identical strings let the ODBC driver manager reuse pooled connections
+_CONN_TMPL = (
+    "DRIVER={{{driver}}};"
+    "SERVER={server},{port};"
+    "DATABASE={database};"
+    "UID={username};"
+    "PWD={password};"
+    "TrustServerCertificate=yes;"
+    "Encrypt=no;"
+    "Connection Timeout=30;"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _pyodbc():
+    """Import pyodbc and list its drivers once; returns (None, None) if unavailable."""
+    try:
+        import pyodbc
+    except ImportError:
+        return None, None
+    # Enable driver-manager connection pooling before the first connect;
+    # the attribute only takes effect if set before any connection exists
+    pyodbc.pooling = True
+    return pyodbc, frozenset(pyodbc.drivers())
+
 
-def get_connection_params() -> Dict[str, Any]:
-    """Get database connection parameters from environment."""
-    return {
+@functools.lru_cache(maxsize=1)
+def get_connection_params() -> Mapping[str, Any]:
+    """
+    Get database connection parameters from environment.
+    
+    The result is read once per process and returned as a read-only
+    mapping; tests can call get_connection_params.cache_clear() to re-read.
+    """
+    return MappingProxyType({
         'server': os.getenv('DATABASE_HOST', 'db'),
         'port': int(os.getenv('DATABASE_PORT', '1433')),
         'database': os.getenv('DATABASE_NAME', 'timesheet_prod'),
         'username': os.getenv('DATABASE_USER', 'sa'),
         'password': os.getenv('DATABASE_PASSWORD', 'YourStrong!Passw0rd'),
         'driver': 'ODBC Driver 18 for SQL Server'
-    }
+    })
+
+
+def _resolve(server: str) -> str:
+    """Return the IPv4 address for server, skipping DNS for dotted-quad literals."""
+    try:
+        socket.inet_aton(server)
+        return server
+    except OSError:
+        return _resolve_hostname(server)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_hostname(server: str) -> str:
+    """Resolve a hostname once per process."""
+    return socket.gethostbyname(server)
+
 
+# Per-attempt connect timeout in seconds for the wait_for_database loop
+PROBE_TIMEOUT = 1.0
 
-def test_network_connectivity(server: str, port: int, timeout: int = 10) -> bool:
-    """Test basic network connectivity to SQL Server."""
+# Upper bound in seconds for the wait_for_database backoff
+MAX_BACKOFF = 30
+
+
+# connect_ex results after which a socket cannot be used for another attempt
+_SOCKET_UNUSABLE_ERRNOS = frozenset({
+    errno.EISCONN, errno.EALREADY, errno.EINPROGRESS, errno.EINVAL,
+    errno.EAGAIN, errno.EWOULDBLOCK, errno.ETIMEDOUT,
+})
+
+
+def _new_probe_socket() -> socket.socket:
+    """Create a non-blocking TCP socket for connectivity probes."""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    return sock
+
+
+def _connect_nonblocking(sock: socket.socket, address: Tuple[str, int], timeout: float) -> int:
+    """
+    Start a non-blocking connect and wait for it with select().
+    
+    Returns 0 on success, otherwise an errno (ETIMEDOUT if the connect
+    did not complete within timeout).
+    """
+    result = sock.connect_ex(address)
+    if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+        _, writable, failed = select.select([], [sock], [sock], timeout)
+        if not (writable or failed):
+            return errno.ETIMEDOUT
+        result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+    return result
+
+
+def test_network_connectivity(server: str, port: int, timeout: float = 10,
+                              sock: Optional[socket.socket] = None) -> bool:
+    """
+    Test basic network connectivity to SQL Server.
+    
+    A caller-supplied socket is left open so it can be reused for the next
+    attempt, unless the connect left it unusable, in which case it is closed.
+    """
     logger.info(f"Testing network connectivity to {server}:{port}...")
     
     try:
-        # Test DNS resolution
-        ip = socket.gethostbyname(server)
+        # Test DNS resolution (cached across attempts)
+        ip = _resolve(server)
         logger.info(f"✓ DNS resolution: {server} -> {ip}")
     except socket.gaierror as e:
         logger.error(f"✗ DNS resolution failed: {e}")
@@ -45,10 +140,18 @@ def test_network_connectivity(server: str, port: int, timeout: int = 10) -> bool
     
     try:
         # Test port connectivity
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        result = sock.connect_ex((server, port))
-        sock.close()
+        own_socket = sock is None
+        if own_socket:
+            sock = _new_probe_socket()
+        result = _connect_nonblocking(sock, (ip, port), timeout)
+        if result == errno.ECONNABORTED and not own_socket:
+            # Linux reports the previous refusal once on a reused socket
+            result = _connect_nonblocking(sock, (ip, port), timeout)
+        if own_socket or result in _SOCKET_UNUSABLE_ERRNOS:
+            sock.close()
+        if result in (errno.ENETUNREACH, errno.EHOSTUNREACH):
+            # The address may have changed; resolve again next time
+            _resolve_hostname.cache_clear()
         
         if result == 0:
             logger.info(f"✓ Port {port} is accessible")
@@ -67,11 +170,13 @@ def check_pyodbc_availability():
     logger.info("Checking pyodbc availability...")
     
     try:
-        import pyodbc
+        pyodbc, drivers = _pyodbc()
+        if pyodbc is None:
+            raise ImportError("pyodbc")
         logger.info("✓ pyodbc is available")
+        logger.info(f"Connection pooling: {'enabled' if pyodbc.pooling else 'disabled'}")
         
-        drivers = pyodbc.drivers()
-        logger.info(f"Available ODBC drivers: {drivers}")
+        logger.info(f"Available ODBC drivers: {sorted(drivers)}")
         
         required_driver = 'ODBC Driver 18 for SQL Server'
         if required_driver in drivers:
@@ -90,27 +195,17 @@ def check_pyodbc_availability():
         return False
 
 
-def test_raw_sql_connection(params: Dict[str, Any]) -> bool:
+def test_raw_sql_connection(params: Mapping[str, Any]) -> bool:
     """Test raw SQL Server connection using pyodbc."""
     logger.info("Testing raw SQL Server connection...")
     
-    try:
-        import pyodbc
-    except ImportError:
+    pyodbc, _ = _pyodbc()
+    if pyodbc is None:
         logger.error("✗ pyodbc not available for connection test")
         return False
     
     # Build connection string
-    conn_str = (
-        f"DRIVER={{{params['driver']}}};"
-        f"SERVER={params['server']},{params['port']};"
-        f"DATABASE={params['database']};"
-        f"UID={params['username']};"
-        f"PWD={params['password']};"
-        f"TrustServerCertificate=yes;"
-        f"Encrypt=no;"
-        f"Connection Timeout=30;"
-    )
+    conn_str = _CONN_TMPL.format(**params)
     
     logger.info("Attempting connection...")
     logger.info(f"Server: {params['server']}:{params['port']}")
@@ -125,13 +220,14 @@ def test_raw_sql_connection(params: Dict[str, Any]) -> bool:
         cursor.execute("SELECT 1 as test, @@VERSION as version")
         result = cursor.fetchone()
         
+        # Closing hands the connection back to the driver-manager pool
+        cursor.close()
+        conn.close()
+        
         if result:
             logger.info(f"✓ Connection successful!")
             logger.info(f"Test query result: {result[0]}")
             logger.info(f"SQL Server version: {result[1][:100]}...")  # Truncate version string
-            
-            cursor.close()
-            conn.close()
             return True
         else:
             logger.error("✗ Connection established but test query failed")
@@ -142,20 +238,27 @@ def test_raw_sql_connection(params: Dict[str, Any]) -> bool:
         return False
 
 
-def test_django_settings():
-    """Test Django settings loading and database configuration."""
+def _setup_django():
+    """Import and set up Django only when it hasn't been already."""
+    import django
+    from django.apps import apps
+    
+    if not apps.ready:
+        django.setup()
+
+
+def test_django_settings() -> Optional[bool]:
+    """Test Django settings loading and database configuration; None if skipped."""
     logger.info("Testing Django settings...")
     
+    if not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        logger.info("- DJANGO_SETTINGS_MODULE not set, skipping Django settings test")
+        return None
+    
     try:
-        # Set Django settings module
-        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'familyhub_timesheet.settings.production')
-        
-        import django
+        _setup_django()
         from django.conf import settings
         
-        if not settings.configured:
-            django.setup()
-        
         # Check database configuration
         db_config = settings.DATABASES['default']
         logger.info("✓ Django settings loaded successfully")
@@ -171,16 +274,16 @@ def test_django_settings():
         return False
 
 
-def test_django_connection():
-    """Test Django database connection."""
+def test_django_connection() -> Optional[bool]:
+    """Test Django database connection; None if skipped."""
     logger.info("Testing Django database connection...")
     
+    if not os.environ.get('DJANGO_SETTINGS_MODULE'):
+        logger.info("- DJANGO_SETTINGS_MODULE not set, skipping Django connection test")
+        return None
+    
     try:
-        os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'familyhub_timesheet.settings.production')
-        
-        import django
-        django.setup()
-        
+        _setup_django()
         from django.db import connection
         
         with connection.cursor() as cursor:
@@ -200,26 +303,49 @@ def test_django_connection():
 
 
 def wait_for_database(max_attempts: int = 30, delay: int = 2) -> bool:
-    """Wait for database to become available."""
-    logger.info(f"Waiting for database (max {max_attempts} attempts, {delay}s intervals)...")
+    """Wait for database to become available, backing off between attempts."""
+    logger.info(f"Waiting for database (max {max_attempts} attempts, {delay}s initial interval)...")
     
     params = get_connection_params()
+    sock = None
+    # Backoff must not stretch the overall wait past the old fixed-interval budget
+    timeout = max_attempts * delay
+    deadline = time.monotonic() + timeout
     
     for attempt in range(1, max_attempts + 1):
         logger.info(f"Attempt {attempt}/{max_attempts}")
         
+        # Reuse one probe socket across refused attempts
+        if sock is None or sock.fileno() == -1:
+            sock = _new_probe_socket()
+        
         # Test network connectivity first
-        if test_network_connectivity(params['server'], params['port']):
+        if test_network_connectivity(params['server'], params['port'],
+                                     timeout=PROBE_TIMEOUT, sock=sock):
+            # The socket is now connected and can't be reused
+            sock.close()
+            
             # If network is good, try database connection
             if test_raw_sql_connection(params):
                 logger.info("✓ Database is ready!")
                 return True
         
-        if attempt < max_attempts:
-            logger.info(f"Database not ready, waiting {delay} seconds...")
-            time.sleep(delay)
+        remaining = deadline - time.monotonic()
+        if attempt >= max_attempts or remaining <= 0:
+            break
+        
+        # Exponential backoff with a little jitter, never past the deadline
+        sleep_for = min(
+            delay * 2 ** min(attempt - 1, 6) + random.uniform(0, 0.5),
+            MAX_BACKOFF,
+            remaining,
+        )
+        logger.info(f"Database not ready, waiting {sleep_for:.1f} seconds...")
+        time.sleep(sleep_for)
     
-    logger.error(f"✗ Database did not become available after {max_attempts * delay} seconds")
+    if sock is not None:
+        sock.close()
+    logger.error(f"✗ Database did not become available after {timeout} seconds ({attempt} attempts)")
     return False
 
 
@@ -242,50 +368,70 @@ def run_comprehensive_test():
     
     # Get connection parameters
     params = get_connection_params()
-    logger.info("Connection parameters:")
+    lines = ["Connection parameters:"]
     for key, value in params.items():
         if 'password' in key.lower():
-            logger.info(f"  {key}: {'*' * len(str(value))}")
+            lines.append(f"  {key}: {'*' * len(str(value))}")
         else:
-            logger.info(f"  {key}: {value}")
+            lines.append(f"  {key}: {value}")
+    logger.info("\n".join(lines))
     
     logger.info("-" * 60)
     
-    # Run tests
-    tests = [
+    # I/O-bound tests are independent and run concurrently
+    concurrent_tests = [
         ("Network Connectivity", lambda: test_network_connectivity(params['server'], params['port'])),
         ("PyODBC Availability", check_pyodbc_availability),
         ("Raw SQL Connection", lambda: test_raw_sql_connection(params)),
+    ]
+    # Django tests share global app setup, so they run in order
+    sequential_tests = [
         ("Django Settings", test_django_settings),
         ("Django Connection", test_django_connection),
     ]
     
-    results = {}
-    for test_name, test_func in tests:
+    def run_test(test):
+        test_name, test_func = test
         logger.info(f"\n--- {test_name} Test ---")
         try:
-            results[test_name] = test_func()
+            return test_func()
         except Exception as e:
             logger.error(f"✗ {test_name} failed with exception: {e}")
-            results[test_name] = False
+            return False
     
-    # Summary
-    logger.info("\n" + "=" * 60)
-    logger.info("TEST SUMMARY")
-    logger.info("=" * 60)
+    results = {}
+    with ThreadPoolExecutor(max_workers=len(concurrent_tests)) as executor:
+        outcomes = executor.map(run_test, concurrent_tests)
+        for (test_name, _), outcome in zip(concurrent_tests, outcomes):
+            results[test_name] = outcome
+    
+    for test in sequential_tests:
+        results[test[0]] = run_test(test)
     
+    # Summary; a None result means the test was skipped, not passed
     passed = 0
-    total = len(results)
+    skipped = 0
+    lines = ["", "=" * 60, "TEST SUMMARY", "=" * 60]
     
     for test_name, result in results.items():
-        status = "✓ PASS" if result else "✗ FAIL"
-        logger.info(f"{test_name}: {status}")
-        if result:
+        if result is None:
+            status = "- SKIP"
+            skipped += 1
+        elif result:
+            status = "✓ PASS"
             passed += 1
+        else:
+            status = "✗ FAIL"
+        lines.append(f"{test_name}: {status}")
     
-    logger.info(f"\nResults: {passed}/{total} tests passed")
+    total = len(results) - skipped
+    lines.append(f"\nResults: {passed}/{total} tests passed, {skipped} skipped")
+    logger.info("\n".join(lines))
     
-    if passed == total:
+    if passed == total and skipped:
+        logger.info(f"✓ All tests that ran passed; {skipped} skipped (DJANGO_SETTINGS_MODULE not set).")
+        return True
+    elif passed == total:
         logger.info("🎉 All tests passed! Database connection is fully operational.")
         return True
     else:
@@ -6,13 +6,14 @@ class JobAdmin(admin.ModelAdmin):
 	list_display = ('name', 'address', 'user', 'created_at')
 	search_fields = ('name', 'address', 'user__username')
 	list_filter = ('user', 'created_at')
+	list_select_related = ('user',)
+	raw_id_fields = ('user',)
 
 @admin.register(TimeEntry)
 class TimeEntryAdmin(admin.ModelAdmin):
 	list_display = ('user', 'job', 'date', 'start_time', 'end_time', 'break_duration', 'total_hours', 'created_at')
 	search_fields = ('user__username', 'job__name', 'date')
 	list_filter = ('user', 'job', 'date')
-	readonly_fields = ('created_at', 'updated_at')
-
-	def total_hours(self, obj):
-		return obj.total_hours()
+	readonly_fields = ('total_hours', 'created_at', 'updated_at')
+	list_select_related = ('user', 'job')
+	raw_id_fields = ('user', 'job')
@@ -1,6 +1,7 @@
 from django import forms
 from .models import Job, TimeEntry
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 from django.utils import timezone
 
 class JobForm(forms.ModelForm):
@@ -28,9 +29,11 @@ class TimeEntryForm(forms.ModelForm):
         self.user = kwargs.pop('user', None)
         super().__init__(*args, **kwargs)
         if self.user:
-            self.fields['job'] = forms.ModelChoiceField(
-                queryset=Job.objects.filter(user=self.user),
-                widget=forms.Select(attrs={'class': 'form-control'})
+            # Choice labels use Job.__str__, which needs name and address
+            self.fields['job'].queryset = (
+                Job.objects.filter(user=self.user)
+                .only('id', 'name', 'address')
+                .order_by('name')
             )
 
     def clean(self):
@@ -41,15 +44,15 @@ class TimeEntryForm(forms.ModelForm):
         end_time = cleaned_data.get('end_time')
         job = cleaned_data.get('job')
         if user and date and start_time and end_time:
-            overlap = TimeEntry.objects.filter(
+            overlap = Q(
                 user=user,
                 date=date,
                 start_time__lt=end_time,
                 end_time__gt=start_time
             )
             if self.instance.pk:
-                overlap = overlap.exclude(pk=self.instance.pk)
-            if overlap.exists():
+                overlap &= ~Q(pk=self.instance.pk)
+            if TimeEntry.objects.filter(overlap).exists():
                 raise ValidationError('Time entry overlaps with an existing entry.')
         if start_time and end_time and start_time >= end_time:
             raise ValidationError('End time must be after start time.')
@@ -4,14 +4,42 @@ Usage: python manage.py test_database_connection
 """
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import connections, transaction
+from django.db import connections
 from django.conf import settings
 import logging
-import time
-import sys
 
 logger = logging.getLogger(__name__)
 
+# Test table DDL per connection.vendor
+_CREATE_SQL = {
+    'sqlite': """
+        CREATE TABLE IF NOT EXISTS test_connection_table (
+            id INTEGER PRIMARY KEY,
+            test_value TEXT
+        )
+    """,
+    'microsoft': """
+        IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='test_connection_table' AND xtype='U')
+        CREATE TABLE test_connection_table (
+            id INT PRIMARY KEY,
+            test_value NVARCHAR(50)
+        )
+    """,
+    'postgresql': """
+        CREATE TABLE IF NOT EXISTS test_connection_table (
+            id INT PRIMARY KEY,
+            test_value VARCHAR(50)
+        )
+    """,
+}
+_CREATE_SQL_DEFAULT = _CREATE_SQL['postgresql']
+
+# Version query and display format per connection.vendor
+_VERSION_QUERIES = {
+    'sqlite': ("SELECT sqlite_version()", "SQLite {version}"),
+    'microsoft': ("SELECT @@VERSION", "SQL Server: {version:.100}..."),
+}
+
 
 class Command(BaseCommand):
     help = 'Test database connectivity and diagnose connection issues'
@@ -121,6 +149,8 @@ class Command(BaseCommand):
     
     def _wait_for_database(self, database_alias, max_attempts, delay, verbose=False):
         """Wait for database to become available."""
+        import time
+        
         if verbose:
             self.stdout.write(f"Waiting for database (max {max_attempts} attempts, {delay}s delay)...")
         
@@ -144,6 +174,9 @@ class Command(BaseCommand):
     
     def _test_table_operations(self, database_alias, verbose=False):
         """Test table creation, insertion, and deletion."""
+        # Only needed for --create-test-table
+        from django.db import transaction
+        
         if verbose:
             self.stdout.write("Testing table operations...")
         
@@ -157,29 +190,7 @@ class Command(BaseCommand):
                         self.stdout.write("Creating test table...")
                     
                     # Handle different database engines
-                    if 'sqlite' in connection.vendor:
-                        create_sql = """
-                            CREATE TABLE IF NOT EXISTS test_connection_table (
-                                id INTEGER PRIMARY KEY,
-                                test_value TEXT
-                            )
-                        """
-                    elif 'microsoft' in connection.vendor or 'mssql' in connection.vendor:
-                        create_sql = """
-                            IF NOT EXISTS (SELECT * FROM sysobjects WHERE name='test_connection_table' AND xtype='U')
-                            CREATE TABLE test_connection_table (
-                                id INT PRIMARY KEY,
-                                test_value NVARCHAR(50)
-                            )
-                        """
-                    else:
-                        create_sql = """
-                            CREATE TABLE IF NOT EXISTS test_connection_table (
-                                id INT PRIMARY KEY,
-                                test_value VARCHAR(50)
-                            )
-                        """
-                    
+                    create_sql = _CREATE_SQL.get(connection.vendor, _CREATE_SQL_DEFAULT)
                     cursor.execute(create_sql)
                     
                     # Insert test data
@@ -223,18 +234,16 @@ class Command(BaseCommand):
         try:
             connection = connections[database_alias]
             
+            version_query = _VERSION_QUERIES.get(connection.vendor)
+            if version_query is None:
+                return f"Database vendor: {connection.vendor}"
+            
+            sql, label = version_query
             with connection.cursor() as cursor:
                 # Try to get database version
-                if 'sqlite' in connection.vendor:
-                    cursor.execute("SELECT sqlite_version()")
-                    version = cursor.fetchone()[0]
-                    return f"SQLite {version}"
-                elif 'microsoft' in connection.vendor or 'mssql' in connection.vendor:
-                    cursor.execute("SELECT @@VERSION")
-                    version = cursor.fetchone()[0]
-                    return f"SQL Server: {version[:100]}..."
-                else:
-                    return f"Database vendor: {connection.vendor}"
+                cursor.execute(sql)
+                version = cursor.fetchone()[0]
+                return label.format(version=version)
                     
         except Exception:
             return "Database info unavailable"
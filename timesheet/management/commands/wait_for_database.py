@@ -6,9 +6,13 @@ Usage: python manage.py wait_for_database
 
 from django.core.management.base import BaseCommand, CommandError
 from django.db import connections
+import random
 import time
 import sys
 
+# Upper bound in seconds for the delay between attempts
+MAX_BACKOFF = 30
+
 
 class Command(BaseCommand):
     help = 'Wait for database to become available'
@@ -30,7 +34,12 @@ class Command(BaseCommand):
             '--interval',
             type=int,
             default=2,
-            help='Check interval in seconds (default: 2)'
+            help='Initial check interval in seconds, doubled after each failed attempt (default: 2)'
+        )
+        parser.add_argument(
+            '--verify-query',
+            action='store_true',
+            help='Run SELECT 1 instead of only checking that a connection can be opened'
         )
         parser.add_argument(
             '--quiet',
@@ -43,38 +52,59 @@ class Command(BaseCommand):
         timeout = options['timeout']
         interval = options['interval']
         quiet = options['quiet']
+        verify_query = options['verify_query']
         
-        max_attempts = timeout // interval
+        deadline = time.monotonic() + timeout
+        attempt = 0
         
         if not quiet:
             self.stdout.write(f"Waiting for database '{database_alias}' to become available...")
-            self.stdout.write(f"Timeout: {timeout}s, Check interval: {interval}s")
+            self.stdout.write(f"Timeout: {timeout}s, Initial check interval: {interval}s")
         
-        for attempt in range(1, max_attempts + 1):
+        while True:
+            attempt += 1
             if not quiet:
-                self.stdout.write(f"Attempt {attempt}/{max_attempts}")
+                self.stdout.write(f"Attempt {attempt}")
             
             try:
                 connection = connections[database_alias]
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
-                    result = cursor.fetchone()
+                connection.ensure_connection()
+                
+                if verify_query:
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                        result = cursor.fetchone()
+                    available = bool(result and result[0] == 1)
+                else:
+                    available = connection.is_usable()
                 
-                if result and result[0] == 1:
+                if available:
                     if not quiet:
                         self.stdout.write(
                             self.style.SUCCESS(f"Database '{database_alias}' is available!")
                         )
                     return
+                
+                # Drop the stale handle so the next attempt reconnects
+                connection.close()
                     
             except Exception as e:
                 if not quiet:
                     self.stdout.write(f"Connection failed: {e}")
             
-            if attempt < max_attempts:
-                if not quiet:
-                    self.stdout.write(f"Waiting {interval} seconds...")
-                time.sleep(interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            
+            # Exponential backoff with jitter, never past the deadline
+            sleep_for = min(
+                interval * 2 ** min(attempt - 1, 6) + random.uniform(0, 0.5),
+                MAX_BACKOFF,
+                remaining,
+            )
+            if not quiet:
+                self.stdout.write(f"Waiting {sleep_for:.1f} seconds...")
+            time.sleep(sleep_for)
         
         # If we get here, the database never became available
         error_msg = f"Database '{database_alias}' did not become available within {timeout} seconds"
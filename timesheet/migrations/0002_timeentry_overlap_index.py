@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-15 06:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timesheet', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='timeentry',
+            index=models.Index(fields=['user', 'date', 'start_time', 'end_time'], name='timesheet_t_user_id_c38e74_idx'),
+        ),
+    ]
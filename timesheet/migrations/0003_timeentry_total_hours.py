@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-15 06:16
+
+from datetime import datetime, timedelta
+
+from django.db import migrations, models
+
+
+def backfill_total_hours(apps, schema_editor):
+    TimeEntry = apps.get_model('timesheet', 'TimeEntry')
+    entries = TimeEntry.objects.only('date', 'start_time', 'end_time', 'break_duration')
+    batch = []
+    for entry in entries.iterator(chunk_size=500):
+        start = datetime.combine(entry.date, entry.start_time)
+        end = datetime.combine(entry.date, entry.end_time)
+        duration = (end - start) - timedelta(minutes=entry.break_duration)
+        entry.total_hours = round(duration.total_seconds() / 3600, 2)
+        batch.append(entry)
+        if len(batch) >= 500:
+            TimeEntry.objects.bulk_update(batch, ['total_hours'])
+            batch = []
+    if batch:
+        TimeEntry.objects.bulk_update(batch, ['total_hours'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('timesheet', '0002_timeentry_overlap_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timeentry',
+            name='total_hours',
+            field=models.FloatField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_total_hours, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,9 @@
+from datetime import datetime, timedelta
 from django.db import models
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
+_combine = datetime.combine
 
 class Job(models.Model):
 	name = models.CharField(max_length=100)
@@ -10,10 +12,10 @@ class Job(models.Model):
 	user = models.ForeignKey(User, on_delete=models.CASCADE)
 
 	def display_name(self):
-		return self.name if self.name else self.address
+		return self.name or self.address
 
 	def __str__(self):
-		return self.display_name()
+		return self.name or self.address
 
 class TimeEntry(models.Model):
 	BREAK_CHOICES = [
@@ -29,16 +31,28 @@ class TimeEntry(models.Model):
 	break_duration = models.IntegerField(choices=BREAK_CHOICES, default=0)
 	created_at = models.DateTimeField(auto_now_add=True)
 	updated_at = models.DateTimeField(auto_now=True)
+	# Worked hours, stored on save so reads and weekly sums need no arithmetic
+	total_hours = models.FloatField(editable=False, default=0)
 
-	def total_hours(self):
-		from datetime import datetime, timedelta
-		start = datetime.combine(self.date, self.start_time)
-		end = datetime.combine(self.date, self.end_time)
+	def compute_total_hours(self):
+		start = _combine(self.date, self.start_time)
+		end = _combine(self.date, self.end_time)
 		duration = (end - start) - timedelta(minutes=self.break_duration)
 		return round(duration.total_seconds() / 3600, 2)
 
+	def save(self, *args, **kwargs):
+		self.total_hours = self.compute_total_hours()
+		update_fields = kwargs.get('update_fields')
+		if update_fields is not None and 'total_hours' not in update_fields:
+			kwargs['update_fields'] = {*update_fields, 'total_hours'}
+		super().save(*args, **kwargs)
+
 	def __str__(self):
-		return f"{self.date} | {self.job.display_name()} | {self.total_hours()} hrs"
+		return f"{self.date} | {self.job} | {self.total_hours} hrs"
 
 	class Meta:
 		unique_together = ('user', 'date', 'start_time')
+		indexes = [
+			# Supports the overlap check in TimeEntryForm.clean
+			models.Index(fields=['user', 'date', 'start_time', 'end_time']),
+		]
@@ -1,14 +1,27 @@
 
+from django.http import Http404, HttpResponseBadRequest
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.utils import timezone
 from django.contrib.auth.forms import UserCreationForm
 from django.contrib.auth import login as auth_login
+from django.db.models import Count, Max, Sum
+from django.views.decorators.http import condition, require_GET, require_http_methods
 from .models import Job, TimeEntry
 from .forms import TimeEntryForm, JobForm
-from datetime import timedelta
+from datetime import date as _date, timedelta
 
+_DAY_OFFSETS = tuple(timedelta(days=i) for i in range(7))
+_WEEK_SPAN = timedelta(days=6)
+
+# Columns rendered by the entry tables, including the joined job's label
+_ENTRY_LIST_FIELDS = (
+    'id', 'date', 'start_time', 'end_time', 'break_duration', 'total_hours',
+    'job__id', 'job__name', 'job__address',
+)
+
+@require_http_methods(['GET', 'POST'])
 def register(request):
     if request.method == 'POST':
         form = UserCreationForm(request.POST)
@@ -22,9 +35,9 @@ def register(request):
     return render(request, 'registration/registration.html', {'form': form})
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def dashboard(request):
     today = timezone.localdate()
-    entries = TimeEntry.objects.filter(user=request.user, date=today)
     if request.method == 'POST':
         form = TimeEntryForm(request.POST, user=request.user)
         if form.is_valid():
@@ -35,13 +48,17 @@ def dashboard(request):
             return redirect('dashboard')
     else:
         form = TimeEntryForm(user=request.user)
+    entries = TimeEntry.objects.select_related('job').only(*_ENTRY_LIST_FIELDS).filter(user=request.user, date=today)
     return render(request, 'dashboard.html', {'entries': entries, 'form': form})
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def daily_entry(request):
     date_str = request.GET.get('date')
-    date = timezone.localdate() if not date_str else timezone.datetime.strptime(date_str, '%Y-%m-%d').date()
-    entries = TimeEntry.objects.filter(user=request.user, date=date)
+    try:
+        date = _date.fromisoformat(date_str) if date_str else timezone.localdate()
+    except ValueError:
+        return HttpResponseBadRequest('Invalid date.')
     if request.method == 'POST':
         form = TimeEntryForm(request.POST, user=request.user)
         if form.is_valid():
@@ -52,24 +69,45 @@ def daily_entry(request):
             return redirect('daily_entry')
     else:
         form = TimeEntryForm(user=request.user)
+    entries = TimeEntry.objects.select_related('job').only(*_ENTRY_LIST_FIELDS).filter(user=request.user, date=date)
     return render(request, 'daily_entry.html', {'entries': entries, 'form': form, 'date': date})
 
+def _current_week_start():
+    today = timezone.localdate()
+    return today - timedelta(days=today.weekday())
+
+def _weekly_etag(request):
+    # Count catches deletions, which leave the latest updated_at unchanged
+    week_start = _current_week_start()
+    stats = TimeEntry.objects.filter(
+        user=request.user, date__range=[week_start, week_start + _WEEK_SPAN]
+    ).aggregate(count=Count('id'), latest=Max('updated_at'))
+    latest = stats['latest'].isoformat() if stats['latest'] else ''
+    return f"{request.user.pk}-{week_start.isoformat()}-{stats['count']}-{latest}"
+
 @login_required
+@require_GET
+@condition(etag_func=_weekly_etag)
 def weekly_summary(request):
-    today = timezone.localdate()
-    week_start = today - timedelta(days=today.weekday())
-    week_dates = [week_start + timedelta(days=i) for i in range(7)]
-    entries = TimeEntry.objects.filter(user=request.user, date__range=[week_start, week_start + timedelta(days=6)])
-    daily_totals = {d: sum(e.total_hours() for e in entries.filter(date=d)) for d in week_dates}
+    week_start = _current_week_start()
+    week_dates = [week_start + d for d in _DAY_OFFSETS]
+    week_entries = TimeEntry.objects.filter(user=request.user, date__range=[week_start, week_start + _WEEK_SPAN])
+    entries = week_entries.select_related('job').only(*_ENTRY_LIST_FIELDS).order_by('date', 'start_time')
+    # At most seven rows; days without entries keep their zero below
+    per_day = week_entries.values('date').annotate(total=Sum('total_hours')).order_by('date')
+    daily_totals = dict.fromkeys(week_dates, 0)
+    daily_totals.update({row['date']: round(row['total'], 2) for row in per_day})
     weekly_total = sum(daily_totals.values())
     return render(request, 'weekly_summary.html', {'week_dates': week_dates, 'daily_totals': daily_totals, 'weekly_total': weekly_total, 'entries': entries})
 
 @login_required
+@require_GET
 def job_list(request):
     jobs = Job.objects.filter(user=request.user)
     return render(request, 'job_list.html', {'jobs': jobs})
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def job_create(request):
     if request.method == 'POST':
         form = JobForm(request.POST)
@@ -84,14 +122,18 @@ def job_create(request):
     return render(request, 'job_form.html', {'form': form})
 
 @login_required
+@require_http_methods(['GET', 'POST'])
 def job_edit(request, pk):
-    job = get_object_or_404(Job, pk=pk, user=request.user)
     if request.method == 'POST':
-        form = JobForm(request.POST, instance=job)
+        form = JobForm(request.POST)
         if form.is_valid():
-            form.save()
+            # The user filter doubles as the ownership check
+            updated = Job.objects.filter(pk=pk, user=request.user).update(**form.cleaned_data)
+            if not updated:
+                raise Http404('No Job matches the given query.')
             messages.success(request, 'Job updated!')
             return redirect('job_list')
-    else:
+    job = get_object_or_404(Job.objects.only('id', 'name', 'address', 'user_id'), pk=pk, user=request.user)
+    if request.method != 'POST':
         form = JobForm(instance=job)
     return render(request, 'job_form.html', {'form': form, 'job': job})